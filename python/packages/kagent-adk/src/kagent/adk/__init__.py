@@ -1,8 +1,19 @@
-import importlib.metadata
-
 from ._a2a import KAgentApp
 from .types import AgentConfig
 
-__version__ = importlib.metadata.version("kagent_adk")
-
 __all__ = ["KAgentApp", "AgentConfig"]
+
+
+def __getattr__(name: str):
+    # PEP 562: resolving the version walks sys.path scanning dist-info
+    # metadata, which is slow on cold starts. Defer it to first access.
+    if name == "__version__":
+        import importlib.metadata
+
+        try:
+            version = importlib.metadata.version("kagent_adk")
+        except importlib.metadata.PackageNotFoundError:
+            version = "0.0.0+unknown"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -97,6 +97,10 @@ class KAgentApp:
                 # TODO: add user  and agent headers
                 base_url=kagent_url_override or self.kagent_url,
                 event_hooks=token_service.event_hooks(),
+                # Session/event/memory calls burst per agent step; keep-alive
+                # pooling lets them reuse connections instead of serializing
+                # on TCP/TLS setup.
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
             )
             session_service = KAgentSessionService(http_client)
 
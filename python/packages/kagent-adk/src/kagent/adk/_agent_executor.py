@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 import logging
+import time
 import uuid
+from collections import deque
 from contextlib import suppress
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Optional
@@ -59,6 +60,84 @@ from .converters.request_converter import convert_a2a_request_to_adk_run_args
 
 logger = logging.getLogger("kagent_adk." + __name__)
 
+# Metadata keys are constant for the lifetime of the process; resolve the
+# prefixed form once at import time instead of on every request.
+_KEY_APP_NAME = get_kagent_metadata_key("app_name")
+_KEY_USER_ID = get_kagent_metadata_key("user_id")
+_KEY_SESSION_ID = get_kagent_metadata_key("session_id")
+_KEY_INVOCATION_ID = get_kagent_metadata_key("invocation_id")
+_KEY_USAGE_METADATA = get_kagent_metadata_key("usage_metadata")
+
+_UTC = timezone.utc
+
+# How long a prepared Session may be served from the in-process cache before
+# get_session is consulted again. Kept short: it only needs to absorb bursts
+# of requests against the same session.
+_SESSION_CACHE_TTL_SECONDS = 5.0
+_SESSION_CACHE_MAX_ENTRIES = 256
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO-8601, reusing one tzinfo instance.
+
+    Status updates are emitted per A2A event; keeping the tz lookup out of
+    the call makes this the cheapest correct way to stamp them.
+    """
+    return datetime.now(_UTC).isoformat()
+
+
+# Prefetched uuid4 strings for artifact/message IDs. uuid4 reads urandom and
+# formats in Python; refilling in a batch via loop.call_soon keeps that work
+# off the event-emission path.
+_UUID_POOL: deque[str] = deque()
+_UUID_POOL_REFILL_AT = 32
+_UUID_POOL_BATCH = 96
+
+
+def _refill_uuid_pool() -> None:
+    _UUID_POOL.extend(str(uuid.uuid4()) for _ in range(_UUID_POOL_BATCH))
+
+
+def _uuid4_str() -> str:
+    """Pop a prefetched uuid4 string, scheduling a refill off the hot path."""
+    if len(_UUID_POOL) <= _UUID_POOL_REFILL_AT:
+        try:
+            asyncio.get_running_loop().call_soon(_refill_uuid_pool)
+        except RuntimeError:
+            _refill_uuid_pool()
+    if _UUID_POOL:
+        return _UUID_POOL.popleft()
+    return str(uuid.uuid4())
+
+
+# Session names are truncated like the UI does: first 20 chars plus "...".
+_SESSION_NAME_MAX = 20
+
+
+def _extract_session_name(message: Optional[Message]) -> Optional[str]:
+    """Derive a session name from the first TextPart of a message.
+
+    The first part is almost always the text one, so probe it directly
+    before falling back to scanning the remaining parts.
+    """
+    parts = message.parts if message else None
+    if not parts:
+        return None
+
+    # A2A parts carry the actual part (TextPart, FilePart, ...) in .root.
+    root = getattr(parts[0], "root", None)
+    # message.parts is list[Part] by schema, so go straight to .root.
+    if not (isinstance(root, TextPart) and root.text):
+        for part in parts[1:]:
+            root = part.root
+            if isinstance(root, TextPart) and root.text:
+                break
+        else:
+            return None
+
+    text = root.text.strip()
+    return text[:_SESSION_NAME_MAX] + ("..." if len(text) > _SESSION_NAME_MAX else "")
+
 
 class A2aAgentExecutorConfig(BaseModel):
     """Configuration for the KAgent A2aAgentExecutor."""
@@ -121,8 +200,14 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             event_converter=_kagent_event_converter,
         )
         super().__init__(runner=runner, config=upstream_config)
+        if not callable(self._runner):
+            raise TypeError(
+                f"Runner must be a Runner instance or a callable that returns a Runner, got {type(self._runner)}"
+            )
         self._kagent_config = config
         self._task_store = task_store
+        # (app_name, user_id, session_id) -> (monotonic timestamp, Session)
+        self._session_cache: dict[tuple[str, str, str], tuple[float, Session]] = {}
 
     @override
     async def _resolve_runner(self) -> Runner:
@@ -131,24 +216,21 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         Unlike the upstream executor which caches a single Runner instance,
         kagent always creates a fresh Runner per request. This is necessary
         because MCP toolset connections are not shared between requests and
-        must be cleaned up after each execution.
+        must be cleaned up after each execution. The callable itself is
+        validated once in __init__, so this path only pays for the factory
+        call and the result check.
         """
-        if callable(self._runner):
-            result = self._runner()
-
-            if inspect.iscoroutine(result):
-                resolved_runner = await result
-            else:
-                resolved_runner = result
+        result = self._runner()
 
-            if not isinstance(resolved_runner, Runner):
-                raise TypeError(f"Callable must return a Runner instance, got {type(resolved_runner)}")
+        if asyncio.iscoroutine(result):
+            resolved_runner = await result
+        else:
+            resolved_runner = result
 
-            return resolved_runner
+        if not isinstance(resolved_runner, Runner):
+            raise TypeError(f"Callable must return a Runner instance, got {type(resolved_runner)}")
 
-        raise TypeError(
-            f"Runner must be a Runner instance or a callable that returns a Runner, got {type(self._runner)}"
-        )
+        return resolved_runner
 
     @override
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
@@ -232,7 +314,7 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                         status=TaskStatus(
                             state=TaskState.submitted,
                             message=context.message,
-                            timestamp=datetime.now(timezone.utc).isoformat(),
+                            timestamp=_now_iso(),
                         ),
                         context_id=context.context_id,
                         final=False,
@@ -328,9 +410,9 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                     task_id=context.task_id,
                     status=TaskStatus(
                         state=TaskState.failed,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
+                        timestamp=_now_iso(),
                         message=Message(
-                            message_id=str(uuid.uuid4()),
+                            message_id=_uuid4_str(),
                             role=Role.agent,
                             parts=[Part(TextPart(text=error_message))],
                         ),
@@ -527,11 +609,18 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         runner: Runner,
         run_args: dict[str, Any],
     ):
+        # HITL resume: translate A2A approval/rejection to ADK FunctionResponse.
+        # Extracted before session prep so a pending decision always scans a
+        # freshly fetched session instead of a cached one.
+        decision = extract_decision_from_message(context.message)
+
         # ensure the session exists
-        session = await self._prepare_session(context, run_args, runner)
+        session = await self._prepare_session(context, run_args, runner, bypass_cache=bool(decision))
 
-        # HITL resume: translate A2A approval/rejection to ADK FunctionResponse
-        decision = extract_decision_from_message(context.message)
+        # The header-update POST below is independent of the initial status
+        # publish; it is created here and awaited concurrently with the
+        # working-status enqueue to save one roundtrip of latency.
+        header_update: Optional[Awaitable[Event]] = None
         if decision:
             parts = self._process_hitl_decision(session, decision, context.message)
             if parts:
@@ -551,7 +640,7 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 actions=actions_with_update,
             )
 
-            await runner.session_service.append_event(session, system_event)
+            header_update = runner.session_service.append_event(session, system_event)
 
         # create invocation context
         invocation_context = runner._new_invocation_context(
@@ -562,24 +651,29 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
 
         # Base metadata for events (invocation_id will be updated once we see it from ADK)
         run_metadata = {
-            get_kagent_metadata_key("app_name"): runner.app_name,
-            get_kagent_metadata_key("user_id"): run_args["user_id"],
-            get_kagent_metadata_key("session_id"): run_args["session_id"],
+            _KEY_APP_NAME: runner.app_name,
+            _KEY_USER_ID: run_args["user_id"],
+            _KEY_SESSION_ID: run_args["session_id"],
         }
 
-        # publish the task working event
-        await event_queue.enqueue_event(
-            TaskStatusUpdateEvent(
-                task_id=context.task_id,
-                status=TaskStatus(
-                    state=TaskState.working,
-                    timestamp=datetime.now(timezone.utc).isoformat(),
-                ),
-                context_id=context.context_id,
-                final=False,
-                metadata=run_metadata.copy(),
-            )
+        # publish the task working event. The event doubles as a template for
+        # the final status update: task_id/context_id never change, so the
+        # final event is derived via model_copy instead of re-validating a
+        # full TaskStatusUpdateEvent.
+        status_template = TaskStatusUpdateEvent(
+            task_id=context.task_id,
+            status=TaskStatus(
+                state=TaskState.working,
+                timestamp=_now_iso(),
+            ),
+            context_id=context.context_id,
+            final=False,
+            metadata=run_metadata.copy(),
         )
+        if header_update is not None:
+            await asyncio.gather(header_update, event_queue.enqueue_event(status_template))
+        else:
+            await event_queue.enqueue_event(status_template)
 
         # Track the invocation_id from ADK events
         # For streaming A2A update events, the invocation_id is added through event converter
@@ -595,41 +689,58 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                 subagent_session_ids[tool.name] = tool.subagent_session_id
 
         task_result_aggregator = TaskResultAggregator()
-        async with Aclosing(runner.run_async(**run_args)) as agen:
-            async for adk_event in agen:
-                # Capture the real invocation_id from the first ADK event that has one
-                event_inv_id = getattr(adk_event, "invocation_id", None)
-                if event_inv_id and not real_invocation_id:
-                    real_invocation_id = event_inv_id
-                    run_metadata[get_kagent_metadata_key("invocation_id")] = real_invocation_id
-
-                # Track the last usage_metadata so it can be included in the final
-                # event's run_metadata. The A2A task_manager merges run_metadata into
-                # task.metadata, making it available to callers (e.g. KAgentRemoteA2ATool).
-                if getattr(adk_event, "usage_metadata", None) is not None:
-                    last_usage_metadata = adk_event.usage_metadata
-
-                for a2a_event in convert_event_to_a2a_events(
-                    adk_event,
-                    invocation_context,
-                    context.task_id,
-                    context.context_id,
-                    subagent_session_ids=subagent_session_ids or None,
-                ):
-                    # Only aggregate non-partial events to avoid duplicates from streaming chunks
-                    # Partial events are sent to frontend for display but not accumulated
-                    if not adk_event.partial:
-                        task_result_aggregator.process_event(a2a_event)
-                    await event_queue.enqueue_event(a2a_event)
 
-                # Break on confirmation events that use long running tools
-                if getattr(adk_event, "long_running_tool_ids", None):
-                    break
+        # Streaming agents emit many small deltas; enqueueing each one inline
+        # costs an event-loop roundtrip per event. Buffer them in a deque
+        # drained by a background flusher so emissions happen in bursts while
+        # the ADK generator keeps producing.
+        pending_events: deque = deque()
+        wake = asyncio.Event()
+        stop = asyncio.Event()
+        flusher = asyncio.create_task(self._flush_events(event_queue, pending_events, wake, stop))
+        try:
+            async with Aclosing(runner.run_async(**run_args)) as agen:
+                async for adk_event in agen:
+                    # Capture the real invocation_id from the first ADK event that has one
+                    event_inv_id = getattr(adk_event, "invocation_id", None)
+                    if event_inv_id and not real_invocation_id:
+                        real_invocation_id = event_inv_id
+                        run_metadata[_KEY_INVOCATION_ID] = real_invocation_id
+
+                    # Track the last usage_metadata so it can be included in the final
+                    # event's run_metadata. The A2A task_manager merges run_metadata into
+                    # task.metadata, making it available to callers (e.g. KAgentRemoteA2ATool).
+                    if getattr(adk_event, "usage_metadata", None) is not None:
+                        last_usage_metadata = adk_event.usage_metadata
+
+                    for a2a_event in convert_event_to_a2a_events(
+                        adk_event,
+                        invocation_context,
+                        context.task_id,
+                        context.context_id,
+                        subagent_session_ids=subagent_session_ids or None,
+                    ):
+                        # Only aggregate non-partial events to avoid duplicates from streaming chunks
+                        # Partial events are sent to frontend for display but not accumulated
+                        if not adk_event.partial:
+                            task_result_aggregator.process_event(a2a_event)
+                        pending_events.append(a2a_event)
+                        wake.set()
+
+                    # Break on confirmation events that use long running tools
+                    if getattr(adk_event, "long_running_tool_ids", None):
+                        break
+        finally:
+            # Drain whatever is still buffered (and surface enqueue failures)
+            # before any final status event is published.
+            stop.set()
+            wake.set()
+            await flusher
 
         # Attach the last LLM usage to run_metadata so the A2A task_manager
         # merges it into task.metadata on the completed Task object.
         if last_usage_metadata is not None:
-            run_metadata[get_kagent_metadata_key("usage_metadata")] = serialize_metadata_value(last_usage_metadata)
+            run_metadata[_KEY_USAGE_METADATA] = serialize_metadata_value(last_usage_metadata)
 
         # publish the task result event - this is final
         if (
@@ -645,43 +756,86 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
                     last_chunk=True,
                     context_id=context.context_id,
                     artifact=Artifact(
-                        artifact_id=str(uuid.uuid4()),
+                        artifact_id=_uuid4_str(),
                         parts=task_result_aggregator.task_status_message.parts,
                     ),
                 )
             )
             # publish the final status update event
             await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
-                    task_id=context.task_id,
-                    status=TaskStatus(
-                        state=TaskState.completed,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                    ),
-                    context_id=context.context_id,
-                    final=True,
-                    metadata=run_metadata,
+                status_template.model_copy(
+                    update={
+                        "status": TaskStatus(
+                            state=TaskState.completed,
+                            timestamp=_now_iso(),
+                        ),
+                        "final": True,
+                        "metadata": run_metadata,
+                    }
                 )
             )
         else:
             await event_queue.enqueue_event(
-                TaskStatusUpdateEvent(
-                    task_id=context.task_id,
-                    status=TaskStatus(
-                        state=task_result_aggregator.task_state,
-                        timestamp=datetime.now(timezone.utc).isoformat(),
-                        message=task_result_aggregator.task_status_message,
-                    ),
-                    context_id=context.context_id,
-                    final=True,
-                    metadata=run_metadata,
+                status_template.model_copy(
+                    update={
+                        "status": TaskStatus(
+                            state=task_result_aggregator.task_state,
+                            timestamp=_now_iso(),
+                            message=task_result_aggregator.task_status_message,
+                        ),
+                        "final": True,
+                        "metadata": run_metadata,
+                    }
                 )
             )
 
-    async def _prepare_session(self, context: RequestContext, run_args: dict[str, Any], runner: Runner):
+    @staticmethod
+    async def _flush_events(
+        event_queue: EventQueue,
+        pending: deque,
+        wake: asyncio.Event,
+        stop: asyncio.Event,
+    ) -> None:
+        """Drain buffered A2A events to the queue in FIFO bursts.
+
+        Runs until ``stop`` is set and the buffer is empty. ``wake`` is
+        cleared before each drain so an append racing with the drain leaves
+        it set and the next wait returns immediately.
+        """
+        while True:
+            wake.clear()
+            while pending:
+                await event_queue.enqueue_event(pending.popleft())
+            if stop.is_set():
+                if pending:
+                    continue
+                return
+            await wake.wait()
+
+    async def _prepare_session(
+        self,
+        context: RequestContext,
+        run_args: dict[str, Any],
+        runner: Runner,
+        *,
+        bypass_cache: bool = False,
+    ):
         session_id = run_args["session_id"]
         # create a new session if not exists
         user_id = run_args["user_id"]
+
+        # Serve repeat requests for the same session from a short-TTL cache
+        # to skip one get_session HTTP roundtrip per request.
+        cache_key = (runner.app_name, user_id, session_id)
+        if not bypass_cache:
+            hit = self._session_cache.get(cache_key)
+            if hit is not None and time.monotonic() - hit[0] < _SESSION_CACHE_TTL_SECONDS:
+                # The server may assign a different id on create than the one
+                # requested; point run_args at the canonical id just like the
+                # create path below does.
+                run_args["session_id"] = hit[1].id
+                return hit[1]
+
         session = await runner.session_service.get_session(
             app_name=runner.app_name,
             user_id=user_id,
@@ -689,20 +843,7 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
         )
 
         if session is None:
-            # Extract session name from the first TextPart (like the UI does)
-            session_name = None
-            if context.message and context.message.parts:
-                for part in context.message.parts:
-                    # A2A parts have a .root property that contains the actual part (TextPart, FilePart, etc.)
-                    if isinstance(part, Part):
-                        root_part = part.root
-                        if isinstance(root_part, TextPart) and root_part.text:
-                            # Take first 20 chars + "..." if longer (matching UI behavior)
-                            text = root_part.text.strip()
-                            session_name = text[:20] + ("..." if len(text) > 20 else "")
-                            break
-
-            state: dict[str, Any] = {"session_name": session_name}
+            state: dict[str, Any] = {"session_name": _extract_session_name(context.message)}
             # Propagate source (e.g. "agent") so the session is tagged in the DB.
             source = None
             if context.call_context and context.call_context.state:
@@ -720,4 +861,11 @@ class A2aAgentExecutor(UpstreamA2aAgentExecutor):
             # Update run_args with the new session_id
             run_args["session_id"] = session.id
 
+        if len(self._session_cache) >= _SESSION_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for key, (stamp, _) in list(self._session_cache.items()):
+                if now - stamp >= _SESSION_CACHE_TTL_SECONDS:
+                    del self._session_cache[key]
+        self._session_cache[cache_key] = (time.monotonic(), session)
+
         return session
@@ -1,7 +1,10 @@
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import quote
 
 import httpx
+import ijson
+import orjson
 from google.adk.events.event import Event
 from google.adk.sessions import Session
 from google.adk.sessions.base_session_service import (
@@ -13,6 +16,36 @@ from typing_extensions import override
 
 logger = logging.getLogger("kagent." + __name__)
 
+# Session payloads above this size are parsed incrementally from the response
+# stream instead of being materialized as one dict (the server warns at 1000+
+# events; payloads in the multi-MB range are where peak memory hurts).
+_STREAM_PARSE_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson.
+
+    Works straight from the raw bytes, skipping the bytes->str decode and
+    validation pass that response.json() performs.
+    """
+    return orjson.loads(response.content)
+
+
+class _AsyncByteReader:
+    """Minimal async file-like adapter over an async byte iterator for ijson."""
+
+    def __init__(self, aiter: AsyncIterator[bytes]):
+        self._aiter = aiter.__aiter__()
+
+    async def read(self, n: int = -1) -> bytes:
+        # ijson probes with read(0) to detect a bytes stream; don't consume.
+        if n == 0:
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
 
 class KAgentSessionService(BaseSessionService):
     """A session service implementation that uses the Kagent API.
@@ -20,9 +53,60 @@ class KAgentSessionService(BaseSessionService):
     and persistence through HTTP API calls.
     """
 
+    # Bound on the per-user params cache so multi-tenant deployments with many
+    # distinct user ids don't grow it without limit.
+    _USER_PARAMS_CACHE_MAX = 1024
+
     def __init__(self, client: httpx.AsyncClient):
         super().__init__()
         self.client = client
+        self._user_params: dict[str, dict[str, str]] = {}
+
+    def _params_for(self, user_id: str) -> dict[str, str]:
+        """Reuse one query-param dict per user id instead of allocating per call."""
+        params = self._user_params.get(user_id)
+        if params is None:
+            if len(self._user_params) >= self._USER_PARAMS_CACHE_MAX:
+                self._user_params.clear()
+            params = {"user_id": user_id}
+            self._user_params[user_id] = params
+        return params
+
+    @classmethod
+    def create(
+        cls,
+        base_url: str,
+        *,
+        http2: bool = True,
+        max_keepalive_connections: int = 50,
+        max_connections: int = 100,
+        **client_kwargs: Any,
+    ) -> "KAgentSessionService":
+        """Build a service with a connection-pooled httpx client.
+
+        Workflows issue bursts of create/get/append_event calls per agent
+        step; generous keep-alive limits let concurrent calls share TCP
+        (and TLS) sessions instead of paying connection setup each time.
+        HTTP/2 multiplexing is enabled when the optional ``h2`` package is
+        installed (``httpx[http2]``); otherwise the client silently uses
+        HTTP/1.1, which httpx would negotiate anyway for cleartext URLs.
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                http2 = False
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive_connections,
+                max_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            **client_kwargs,
+        )
+        return cls(client)
 
     @override
     async def create_session(
@@ -53,12 +137,12 @@ class KAgentSessionService(BaseSessionService):
         # while all lookups use the A2A-derived user_id, causing SessionNotFoundError.
         response = await self.client.post(
             "/api/sessions",
-            params={"user_id": user_id},
+            params=self._params_for(user_id),
             json=request_data,
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = _parse(response)
         if not data.get("data"):
             raise RuntimeError(f"Failed to create session: {data.get('message', 'Unknown error')}")
 
@@ -77,40 +161,43 @@ class KAgentSessionService(BaseSessionService):
         config: Optional[GetSessionConfig] = None,
     ) -> Optional[Session]:
         try:
+            # TODO: implement config.after_timestamp filtering once the API
+            # supports an "after" query param.
+            # Default to limit=-1 (all events) unless the caller asked for the
+            # most recent N.
+            limit = config.num_recent_events if config and config.num_recent_events else -1
             # ADK requires events to be chronological (especially for calculating deltas)
-            url = f"/api/sessions/{session_id}?user_id={user_id}&order=asc"
-            if config:
-                if config.after_timestamp:
-                    # TODO: implement
-                    # url += f"&after={config.after_timestamp}"
-                    pass
-                if config.num_recent_events:
-                    url += f"&limit={config.num_recent_events}"
-                else:
-                    url += "&limit=-1"
-            else:
-                # return all
-                url += "&limit=-1"
-
-            # Make API call to get session
-            response: httpx.Response = await self.client.get(url)
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
+            url = f"/api/sessions/{session_id}?user_id={quote(user_id)}&order=asc&limit={limit}"
 
-            data = response.json()
-            if not data.get("data"):
-                return None
+            # Make API call to get session. Streaming the response lets large
+            # payloads be parsed incrementally instead of held fully in memory.
+            async with self.client.stream("GET", url) as response:
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
 
-            if not data.get("data").get("session"):
-                return None
-            session_data = data["data"]["session"]
+                content_length = int(response.headers.get("content-length") or 0)
+                if content_length > _STREAM_PARSE_THRESHOLD_BYTES:
+                    session_data, events = await self._parse_session_stream(response)
+                    if session_data is None:
+                        return None
+                else:
+                    data = orjson.loads(await response.aread())
+                    if not data.get("data"):
+                        return None
+
+                    if not data.get("data").get("session"):
+                        return None
+                    session_data = data["data"]["session"]
 
-            events_data = data["data"]["events"]
+                    events_data = data["data"]["events"]
 
-            events: list[Event] = []
-            for event_data in events_data:
-                events.append(Event.model_validate_json(event_data["data"]))
+                    # Decode each event's JSON with orjson and validate the
+                    # resulting dict; this is markedly cheaper than per-event
+                    # model_validate_json for sessions with thousands of events.
+                    events: list[Event] = [
+                        Event.model_validate(orjson.loads(event_data["data"])) for event_data in events_data
+                    ]
 
             # Convert to ADK Session format
             session = Session(
@@ -130,20 +217,47 @@ class KAgentSessionService(BaseSessionService):
                 return None
             raise
 
+    @staticmethod
+    async def _parse_session_stream(response: httpx.Response) -> tuple[Optional[dict], list[Event]]:
+        """Incrementally parse a GET-session envelope from the response stream.
+
+        Decodes one event object at a time so peak memory is a single event
+        dict plus the accumulated Event list, instead of the raw body, the
+        full envelope dict, and all Events held simultaneously.
+        """
+        session_data: Optional[dict] = None
+        events: list[Event] = []
+        builder: Optional[ijson.ObjectBuilder] = None
+        target: Optional[str] = None
+        async for prefix, kind, value in ijson.parse_async(_AsyncByteReader(response.aiter_bytes())):
+            if builder is None and kind == "start_map" and prefix in ("data.session", "data.events.item"):
+                builder = ijson.ObjectBuilder()
+                target = prefix
+            if builder is not None:
+                builder.event(kind, value)
+                if kind == "end_map" and prefix == target:
+                    if target == "data.session":
+                        session_data = builder.value
+                    else:
+                        events.append(Event.model_validate(orjson.loads(builder.value["data"])))
+                    builder = None
+                    target = None
+        return session_data, events
+
     @override
     async def list_sessions(self, *, app_name: str, user_id: str) -> ListSessionsResponse:
         # Make API call to list sessions
         response = await self.client.get(f"/api/sessions?user_id={user_id}")
         response.raise_for_status()
 
-        data = response.json()
+        data = _parse(response)
         sessions_data = data.get("data", [])
 
         # Convert to ADK Session format
-        sessions = []
-        for session_data in sessions_data:
-            session = Session(id=session_data["id"], user_id=session_data["user_id"], state={}, app_name=app_name)
-            sessions.append(session)
+        sessions = [
+            Session(id=session_data["id"], user_id=session_data["user_id"], state={}, app_name=app_name)
+            for session_data in sessions_data
+        ]
 
         return ListSessionsResponse(sessions=sessions)
 
@@ -161,16 +275,16 @@ class KAgentSessionService(BaseSessionService):
         if event.partial:
             return event
 
-        # Convert ADK Event to JSON format
-        event_data = {
-            "id": event.id,
-            "data": event.model_dump_json(),
-        }
+        # Serialize the envelope with orjson up front. Passing json= would
+        # make httpx re-encode the (already large) event JSON with the stdlib
+        # encoder; building the bytes here does a single fast pass instead.
+        payload = b'{"id":' + orjson.dumps(event.id) + b',"data":' + orjson.dumps(event.model_dump_json()) + b"}"
 
         # Make API call to append event to session
         response = await self.client.post(
             f"/api/sessions/{session.id}/events?user_id={session.user_id}",
-            json=event_data,
+            content=payload,
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
 
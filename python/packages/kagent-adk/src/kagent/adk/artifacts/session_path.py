@@ -46,7 +46,7 @@ def initialize_session_path(session_id: str, skills_directory: str) -> Path:
     if skills_mount.exists() and not skills_link.exists():
         try:
             skills_link.symlink_to(skills_mount)
-            logger.debug(f"Created symlink: {skills_link} -> {skills_mount}")
+            logger.debug("Created symlink: %s -> %s", skills_link, skills_mount)
         except FileExistsError:
             # Symlink already exists (race condition from concurrent session setup)
             pass
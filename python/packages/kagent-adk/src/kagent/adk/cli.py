@@ -172,7 +172,7 @@ def run(
             config = json.load(f)
         agent_config = AgentConfig.model_validate(config)
     except FileNotFoundError:
-        logger.debug(f"No config.json found at {config_path}, using defaults")
+        logger.debug("No config.json found at %s, using defaults", config_path)
 
     with open(os.path.join(working_dir, name, "agent-card.json"), "r") as f:
         agent_card = json.load(f)
@@ -14,6 +14,7 @@ from google.adk.models.llm_response import LlmResponse
 from google.genai import types
 from ollama import AsyncClient
 from ollama import Message as OllamaMessage
+from pydantic import PrivateAttr
 
 from ._ssl import KAgentTLSMixin
 
@@ -23,6 +24,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# AsyncClients shared across model instances with identical connection
+# config, so workflows that build one driver per agent reuse a single
+# connection pool (and its keep-alive sockets) instead of opening one per
+# instance. Keyed by host, headers, and the TLS fields that feed
+# _tls_httpx_kwargs.
+_SHARED_CLIENTS: dict[tuple, AsyncClient] = {}
+
+
 def _done_reason_to_finish_reason(done_reason: str) -> types.FinishReason:
     if done_reason == "length":
         return types.FinishReason.MAX_TOKENS
@@ -74,14 +83,14 @@ def _convert_content_to_ollama_messages(
             messages.append(OllamaMessage(role="assistant", tool_calls=tool_calls))
 
         if function_responses:
-            for fr in function_responses:
-                messages.append(
-                    OllamaMessage(
-                        role="tool",
-                        content=_extract_response_content(fr.response),
-                        tool_name=fr.name or "",
-                    )
+            messages.extend(
+                OllamaMessage(
+                    role="tool",
+                    content=_extract_response_content(fr.response),
+                    tool_name=fr.name or "",
                 )
+                for fr in function_responses
+            )
         elif text_parts or images:
             msg = OllamaMessage(role=role, content="\n".join(text_parts) or None)
             if images:
@@ -159,17 +168,43 @@ class KAgentOllamaLlm(KAgentTLSMixin, BaseLlm):
     default_headers: Optional[dict[str, str]] = None
     api_key_passthrough: Optional[bool] = None
 
+    # Tool-schema conversion is deterministic, and the tool list is identical
+    # across the turns of a session, so cache the last converted list instead
+    # of rebuilding the schema dicts on every request. The cache keeps a
+    # reference to the source tools so their ids stay valid for the key.
+    _tools_cache_key: Optional[tuple[int, ...]] = PrivateAttr(default=None)
+    _tools_cache_src: Optional[list[types.Tool]] = PrivateAttr(default=None)
+    _tools_cache_value: Optional[list[ollama_sdk.Tool]] = PrivateAttr(default=None)
+
+    def _ollama_tools_for(self, genai_tools: list[types.Tool]) -> Optional[list[ollama_sdk.Tool]]:
+        key = tuple(id(t) for t in genai_tools)
+        if key != self._tools_cache_key:
+            self._tools_cache_value = _convert_tools_to_ollama(genai_tools) or None
+            self._tools_cache_key = key
+            self._tools_cache_src = genai_tools
+        return self._tools_cache_value
+
     @cached_property
     def _client(self) -> AsyncClient:
         host = os.environ.get("OLLAMA_API_BASE", "http://localhost:11434")
-        kwargs: dict[str, object] = {
-            "host": host,
-            "headers": self.default_headers or {},
-        }
-
-        kwargs.update(self._tls_httpx_kwargs())
-
-        return AsyncClient(**kwargs)
+        key = (
+            host,
+            frozenset((self.default_headers or {}).items()),
+            self.tls_disable_verify,
+            self.tls_ca_cert_path,
+            self.tls_disable_system_cas,
+        )
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            kwargs: dict[str, object] = {
+                "host": host,
+                "headers": self.default_headers or {},
+            }
+
+            kwargs.update(self._tls_httpx_kwargs())
+
+            client = _SHARED_CLIENTS[key] = AsyncClient(**kwargs)
+        return client
 
     @classmethod
     def supported_models(cls) -> list[str]:
@@ -192,26 +227,34 @@ class KAgentOllamaLlm(KAgentTLSMixin, BaseLlm):
         if llm_request.config and llm_request.config.tools:
             genai_tools = [t for t in llm_request.config.tools if hasattr(t, "function_declarations")]
             if genai_tools:
-                tools = _convert_tools_to_ollama(genai_tools) or None
+                tools = self._ollama_tools_for(genai_tools)
+
+        # Resolve per-call invariants once instead of re-evaluating them in
+        # each branch below; only the stream flag differs between branches.
+        chat_kwargs = {
+            "model": llm_request.model or self.model,
+            "messages": messages,
+            "tools": tools,
+            "options": self.ollama_options or None,
+        }
 
         try:
             if stream:
                 aggregated_text = ""
                 tool_calls = []
-                response: AsyncIterator[ollama_sdk.ChatResponse] = await self._client.chat(
-                    model=llm_request.model or self.model,
-                    messages=messages,
-                    tools=tools,
-                    options=self.ollama_options or None,
-                    stream=True,
-                )
+                response: AsyncIterator[ollama_sdk.ChatResponse] = await self._client.chat(**chat_kwargs, stream=True)
                 async for chunk in response:
                     tool_calls.extend(chunk.message.tool_calls or [])
                     if chunk.message.content:
                         aggregated_text += chunk.message.content
-                        yield LlmResponse(
-                            content=types.Content(
-                                role="model", parts=[types.Part.from_text(text=chunk.message.content)]
+                        # This runs once per streamed token; the delta is a
+                        # plain text string we just produced, so skip pydantic
+                        # validation with model_construct. Final and
+                        # non-streaming responses keep the validated path.
+                        yield LlmResponse.model_construct(
+                            content=types.Content.model_construct(
+                                role="model",
+                                parts=[types.Part.model_construct(text=chunk.message.content)],
                             ),
                             partial=True,
                             turn_complete=False,
@@ -237,13 +280,7 @@ class KAgentOllamaLlm(KAgentTLSMixin, BaseLlm):
                             usage_metadata=usage_metadata,
                         )
             else:
-                response = await self._client.chat(
-                    model=llm_request.model or self.model,
-                    messages=messages,
-                    tools=tools,
-                    options=self.ollama_options or None,
-                    stream=False,
-                )
+                response = await self._client.chat(**chat_kwargs, stream=False)
                 parts = []
                 if response.message.content:
                     parts.append(types.Part.from_text(text=response.message.content))
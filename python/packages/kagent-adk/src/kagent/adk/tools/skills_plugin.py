@@ -32,21 +32,21 @@ def add_skills_tool_to_agent(
     # Add SkillsTool if not already present
     if "skills" not in existing_tool_names:
         agent.tools.append(SkillsTool(skills_directory))
-        logger.debug(f"Added skills invoke tool to agent: {agent.name}")
+        logger.debug("Added skills invoke tool to agent: %s", agent.name)
 
     # Add BashTool if not already present
     if "bash" not in existing_tool_names:
         agent.tools.append(BashTool(skills_directory))
-        logger.debug(f"Added bash tool to agent: {agent.name}")
+        logger.debug("Added bash tool to agent: %s", agent.name)
 
     if "read_file" not in existing_tool_names:
         agent.tools.append(ReadFileTool(skills_directory))
-        logger.debug(f"Added read file tool to agent: {agent.name}")
+        logger.debug("Added read file tool to agent: %s", agent.name)
 
     if "write_file" not in existing_tool_names:
         agent.tools.append(WriteFileTool())
-        logger.debug(f"Added write file tool to agent: {agent.name}")
+        logger.debug("Added write file tool to agent: %s", agent.name)
 
     if "edit_file" not in existing_tool_names:
         agent.tools.append(EditFileTool())
-        logger.debug(f"Added edit file tool to agent: {agent.name}")
+        logger.debug("Added edit file tool to agent: %s", agent.name)
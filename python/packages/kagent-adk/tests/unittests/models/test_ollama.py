@@ -6,10 +6,24 @@ from unittest import mock
 import pytest
 from google.genai import types
 
-from kagent.adk.models._ollama import KAgentOllamaLlm, _convert_content_to_ollama_messages, create_ollama_llm
+from kagent.adk.models._ollama import (
+    KAgentOllamaLlm,
+    _convert_content_to_ollama_messages,
+    _convert_tools_to_ollama,
+    create_ollama_llm,
+)
 
 
 class TestKAgentOllamaLlm:
+    @pytest.fixture(autouse=True)
+    def _fresh_client_pool(self):
+        """Isolate the module-level shared-client pool between tests."""
+        from kagent.adk.models import _ollama
+
+        _ollama._SHARED_CLIENTS.clear()
+        yield
+        _ollama._SHARED_CLIENTS.clear()
+
     def test_default_construction(self):
         llm = KAgentOllamaLlm(model="llama3.2:latest")
         assert llm.model == "llama3.2:latest"
@@ -39,6 +53,15 @@ class TestKAgentOllamaLlm:
             _ = llm._client
             assert mock_client.call_args.kwargs["headers"] == {"X-Custom": "val"}
 
+    def test_client_shared_across_instances_with_same_config(self):
+        llm_a = KAgentOllamaLlm(model="llama3.2:latest")
+        llm_b = KAgentOllamaLlm(model="qwen2.5:7b")
+        llm_c = KAgentOllamaLlm(model="llama3.2:latest", default_headers={"X-Custom": "val"})
+        with mock.patch("kagent.adk.models._ollama.AsyncClient", side_effect=lambda **kw: mock.MagicMock()):
+            # Same connection config -> one pooled client; different headers -> a new one.
+            assert llm_a._client is llm_b._client
+            assert llm_c._client is not llm_a._client
+
     def test_ollama_options_stored(self):
         opts = {"temperature": 0.8, "top_k": 40, "num_ctx": 4096}
         llm = KAgentOllamaLlm(model="llama3.2:latest", ollama_options=opts)
@@ -92,6 +115,42 @@ class TestKAgentOllamaLlm:
 
         assert mock_client.chat.call_args.kwargs["options"] == opts
 
+    @pytest.mark.asyncio
+    async def test_tool_conversion_cached_across_requests(self):
+        llm = KAgentOllamaLlm(model="llama3.2:latest")
+
+        mock_response = mock.MagicMock()
+        mock_response.message.content = "ok"
+        mock_response.message.tool_calls = []
+
+        mock_client = mock.AsyncMock()
+        mock_client.chat = mock.AsyncMock(return_value=mock_response)
+
+        tool = types.Tool(
+            function_declarations=[types.FunctionDeclaration(name="get_weather", description="Get the weather")]
+        )
+        request = mock.MagicMock()
+        request.model = "llama3.2:latest"
+        request.contents = []
+        request.config = mock.MagicMock()
+        request.config.system_instruction = None
+        request.config.tools = [tool]
+
+        with mock.patch.object(type(llm), "_client", new_callable=lambda: property(lambda self: mock_client)):
+            with mock.patch(
+                "kagent.adk.models._ollama._convert_tools_to_ollama",
+                wraps=_convert_tools_to_ollama,
+            ) as mock_convert:
+                [r async for r in llm.generate_content_async(request, stream=False)]
+                first_tools = mock_client.chat.call_args.kwargs["tools"]
+                [r async for r in llm.generate_content_async(request, stream=False)]
+                second_tools = mock_client.chat.call_args.kwargs["tools"]
+
+        # Same tool list -> converted once, second call reuses the cached result.
+        mock_convert.assert_called_once()
+        assert second_tools is first_tools
+        assert first_tools[0].function.name == "get_weather"
+
     @pytest.mark.asyncio
     async def test_generate_content_streaming_accumulates_tool_calls_before_done_chunk(self):
         llm = KAgentOllamaLlm(model="llama3.2:latest")
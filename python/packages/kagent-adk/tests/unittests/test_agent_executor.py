@@ -0,0 +1,224 @@
+"""Tests for A2aAgentExecutor's session cache and buffered event flusher."""
+
+import asyncio
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from a2a.types import Message, Role, TaskState, TaskStatusUpdateEvent
+from google.adk.events import Event
+from google.adk.sessions import Session
+from google.genai import types as genai_types
+
+from kagent.adk._agent_executor import A2aAgentExecutor
+
+
+def _make_runner(get_session: Session | None = None, create_session: Session | None = None) -> MagicMock:
+    runner = MagicMock()
+    runner.app_name = "app"
+    runner.session_service.get_session = AsyncMock(return_value=get_session)
+    runner.session_service.create_session = AsyncMock(return_value=create_session)
+    return runner
+
+
+def _make_context() -> MagicMock:
+    context = MagicMock()
+    context.message = None
+    context.call_context = None
+    return context
+
+
+class TestPrepareSessionCache:
+    """Tests for the short-TTL session cache in _prepare_session."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_within_ttl_served_from_cache(self):
+        session = Session(id="s1", app_name="app", user_id="u1")
+        runner = _make_runner(get_session=session)
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        first = await executor._prepare_session(_make_context(), {"session_id": "s1", "user_id": "u1"}, runner)
+        second = await executor._prepare_session(_make_context(), {"session_id": "s1", "user_id": "u1"}, runner)
+
+        assert first is session
+        assert second is session
+        runner.session_service.get_session.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_after_ttl(self, monkeypatch):
+        monkeypatch.setattr("kagent.adk._agent_executor._SESSION_CACHE_TTL_SECONDS", 0.0)
+        session = Session(id="s1", app_name="app", user_id="u1")
+        runner = _make_runner(get_session=session)
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        await executor._prepare_session(_make_context(), {"session_id": "s1", "user_id": "u1"}, runner)
+        await executor._prepare_session(_make_context(), {"session_id": "s1", "user_id": "u1"}, runner)
+
+        assert runner.session_service.get_session.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass_cache_refetches_session(self):
+        """HITL decisions must scan a freshly fetched session, not a cached one."""
+        session = Session(id="s1", app_name="app", user_id="u1")
+        runner = _make_runner(get_session=session)
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        await executor._prepare_session(_make_context(), {"session_id": "s1", "user_id": "u1"}, runner)
+        await executor._prepare_session(
+            _make_context(), {"session_id": "s1", "user_id": "u1"}, runner, bypass_cache=True
+        )
+
+        assert runner.session_service.get_session.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_rewrites_run_args_to_canonical_session_id(self):
+        """A cache hit must point run_args at the server-assigned session id.
+
+        If the server assigns a different id on create than the one requested,
+        a repeat request within the TTL would otherwise call run_async with the
+        stale requested id and ADK would silently fork a new session.
+        """
+        created = Session(id="server-id", app_name="app", user_id="u1")
+        runner = _make_runner(get_session=None, create_session=created)
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        first_args = {"session_id": "requested-id", "user_id": "u1"}
+        await executor._prepare_session(_make_context(), first_args, runner)
+        assert first_args["session_id"] == "server-id"
+
+        repeat_args = {"session_id": "requested-id", "user_id": "u1"}
+        session = await executor._prepare_session(_make_context(), repeat_args, runner)
+
+        assert session is created
+        assert repeat_args["session_id"] == "server-id"
+
+
+class TestFlushEvents:
+    """Tests for the background event flusher used by _handle_request."""
+
+    @pytest.mark.asyncio
+    async def test_flush_events_preserves_fifo_order(self):
+        enqueued: list[int] = []
+        first_burst_drained = asyncio.Event()
+
+        def record(event):
+            enqueued.append(event)
+            if len(enqueued) == 5:
+                first_burst_drained.set()
+
+        event_queue = MagicMock()
+        event_queue.enqueue_event = AsyncMock(side_effect=record)
+        pending: deque = deque()
+        wake = asyncio.Event()
+        stop = asyncio.Event()
+        flusher = asyncio.create_task(A2aAgentExecutor._flush_events(event_queue, pending, wake, stop))
+
+        pending.extend(range(5))
+        wake.set()
+        # Let the flusher drain the first burst before appending more.
+        await first_burst_drained.wait()
+        pending.extend([5, 6])
+        wake.set()
+        stop.set()
+        await flusher
+
+        assert enqueued == list(range(7))
+
+    @pytest.mark.asyncio
+    async def test_flush_events_drains_buffer_on_stop(self):
+        """Events still buffered when stop is set are flushed before returning."""
+        enqueued: list[int] = []
+        event_queue = MagicMock()
+        event_queue.enqueue_event = AsyncMock(side_effect=enqueued.append)
+        pending: deque = deque(range(3))
+        wake = asyncio.Event()
+        stop = asyncio.Event()
+        flusher = asyncio.create_task(A2aAgentExecutor._flush_events(event_queue, pending, wake, stop))
+
+        stop.set()
+        wake.set()
+        await flusher
+
+        assert enqueued == [0, 1, 2]
+        assert not pending
+
+
+def _make_handle_request_harness():
+    """Build the context/runner/run_args mocks _handle_request needs."""
+    session = Session(id="s1", app_name="app", user_id="u1")
+    runner = _make_runner(get_session=session)
+    runner.agent = MagicMock()
+    runner.agent.tools = []
+    runner.session_service.append_event = AsyncMock()
+    invocation_context = MagicMock()
+    invocation_context.app_name = "app"
+    invocation_context.user_id = "u1"
+    invocation_context.session = session
+    runner._new_invocation_context = MagicMock(return_value=invocation_context)
+
+    async def run_async(**kwargs):
+        yield Event(
+            author="agent",
+            invocation_id="inv1",
+            content=genai_types.Content(role="model", parts=[genai_types.Part(text="hello")]),
+        )
+
+    runner.run_async = run_async
+
+    context = MagicMock()
+    context.message = Message(role=Role.user, message_id="m1", task_id="task1", context_id="ctx1", parts=[])
+    context.task_id = "task1"
+    context.context_id = "ctx1"
+    context.call_context.state = {}
+
+    run_args = {
+        "user_id": "u1",
+        "session_id": "s1",
+        "new_message": genai_types.Content(role="user", parts=[genai_types.Part(text="hi")]),
+        "run_config": MagicMock(),
+    }
+    return runner, context, run_args
+
+
+class TestHandleRequestFlushing:
+    """End-to-end tests of _handle_request's buffered event emission."""
+
+    @pytest.mark.asyncio
+    async def test_buffer_drained_before_final_status_event(self):
+        runner, context, run_args = _make_handle_request_harness()
+        enqueued: list = []
+        event_queue = MagicMock()
+        event_queue.enqueue_event = AsyncMock(side_effect=enqueued.append)
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        await executor._handle_request(context, event_queue, runner, run_args)
+
+        # Working status first, streamed events in the middle, exactly one
+        # final status event and nothing after it.
+        assert isinstance(enqueued[0], TaskStatusUpdateEvent)
+        assert enqueued[0].status.state == TaskState.working
+        assert not enqueued[0].final
+        finals = [i for i, e in enumerate(enqueued) if getattr(e, "final", False)]
+        assert finals == [len(enqueued) - 1]
+        # The streamed ADK event made it out between working and final.
+        assert len(enqueued) > 2
+
+    @pytest.mark.asyncio
+    async def test_flusher_enqueue_failure_propagates(self):
+        runner, context, run_args = _make_handle_request_harness()
+        calls = 0
+
+        async def failing_enqueue(event):
+            nonlocal calls
+            calls += 1
+            # First call is the working status published inline; everything
+            # after that goes through the flusher.
+            if calls > 1:
+                raise RuntimeError("queue closed")
+
+        event_queue = MagicMock()
+        event_queue.enqueue_event = failing_enqueue
+        executor = A2aAgentExecutor(runner=MagicMock())
+
+        with pytest.raises(RuntimeError, match="queue closed"):
+            await executor._handle_request(context, event_queue, runner, run_args)
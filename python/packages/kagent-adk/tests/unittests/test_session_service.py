@@ -1,5 +1,7 @@
 """Tests for KAgentSessionService."""
 
+import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
@@ -44,13 +46,29 @@ def mock_client():
     """Factory fixture: mock_client(response_json, status_code) -> MagicMock httpx.AsyncClient."""
 
     def _factory(response_json: dict | None, status_code: int = 200) -> MagicMock:
+        content = json.dumps(response_json).encode()
+
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = status_code
+        mock_response.headers = {"content-length": str(len(content))}
         mock_response.json.return_value = response_json
+        mock_response.content = content
+        mock_response.aread = AsyncMock(return_value=content)
         mock_response.raise_for_status = MagicMock()
 
+        async def _aiter_bytes():
+            yield content
+
+        mock_response.aiter_bytes = _aiter_bytes
+
         client = MagicMock(spec=httpx.AsyncClient)
         client.get = AsyncMock(return_value=mock_response)
+
+        @asynccontextmanager
+        async def _stream(method: str, url: str, **kwargs):
+            yield mock_response
+
+        client.stream = _stream
         return client
 
     return _factory
@@ -79,7 +97,7 @@ async def test_create_session_passes_user_id_as_query_param():
     """
     mock_response = MagicMock(spec=httpx.Response)
     mock_response.status_code = 201
-    mock_response.json.return_value = {"data": {"id": "sess-1", "user_id": "A2A_USER_ctx123"}}
+    mock_response.content = json.dumps({"data": {"id": "sess-1", "user_id": "A2A_USER_ctx123"}}).encode()
     mock_response.raise_for_status = MagicMock()
 
     client = MagicMock(spec=httpx.AsyncClient)
@@ -161,6 +179,21 @@ async def test_get_session_empty_events(session_response, service):
     assert len(session.events) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_session_stream_parses_large_payloads(make_event, session_response, mock_client, monkeypatch):
+    """Payloads above the streaming threshold are parsed incrementally via ijson."""
+    events = [make_event("user"), make_event("assistant")]
+    client = mock_client(session_response(events))
+    # Force the content-length check over the threshold so the streaming path runs.
+    monkeypatch.setattr("kagent.adk._session_service._STREAM_PARSE_THRESHOLD_BYTES", 0)
+
+    svc = KAgentSessionService(client)
+    session = await svc.get_session(app_name="app", user_id="u1", session_id="s1")
+
+    assert session is not None
+    assert [e.id for e in session.events] == [e.id for e in events]
+
+
 @pytest.mark.asyncio
 async def test_get_session_state_delta_applied_once(make_event, session_response, service):
     """State deltas from events must be applied exactly once to session.state.